@@ -12,7 +12,14 @@ Usage examples:
 from __future__ import annotations
 
 import argparse
+import asyncio
+import functools
+import os
+import sqlite3
+import stat
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import ClassVar
 
@@ -46,17 +53,43 @@ THRESH_CYAN = 50
 ICON_DIR = "📁"
 ICON_FILE = "📄"
 ICON_DISK = "💾"
-
-
-def _format_bytes(bytes_val: float) -> str:
-    """Format bytes into human-readable format."""
+BAR_MAX_WIDTH = 30
+# Bars are sliced out of these instead of multiplying characters per call
+BAR_FILLED = "█" * BAR_MAX_WIDTH
+BAR_EMPTY = "░" * BAR_MAX_WIDTH
+SCAN_WORKERS = 16
+SMALL_DIR_ENTRIES = 32
+ANSI_COLORS = {
+    "red": "\033[91m",
+    "yellow": "\033[93m",
+    "cyan": "\033[96m",
+    "green": "\033[92m",
+}
+ANSI_RESET = "\033[0m"
+# Pseudo filesystems that never hold user data; statvfs on them is wasted work
+SKIP_FSTYPES = frozenset(
+    {"autofs", "cgroup", "cgroup2", "devtmpfs", "proc", "squashfs", "sysfs", "tmpfs"},
+)
+DISK_ROW_FORMAT = (
+    "{device:<20} {color}{percent:>6.1f}%{reset}   "
+    "{used:>8} / {total:<8} {color}{bar}{reset} {mount:<20}"
+)
+TABLE_RULE = "=" * 100
+TABLE_SEPARATOR = "-" * 100
+SIZE_CACHE_PATH = Path("~/.cache/pydisk/sizes.sqlite")
+
+
+@functools.lru_cache(maxsize=8192)
+def _format_bytes(bytes_val: int) -> str:
+    """Format bytes into human-readable format (memoized, sizes repeat across repaints)."""
     if bytes_val < 0:
         return "0B"
+    size = float(bytes_val)
     for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if bytes_val < BYTES_UNIT:
-            return f"{bytes_val:.1f}{unit}"
-        bytes_val /= BYTES_UNIT
-    return f"{bytes_val:.1f}PB"
+        if size < BYTES_UNIT:
+            return f"{size:.1f}{unit}"
+        size /= BYTES_UNIT
+    return f"{size:.1f}PB"
 
 
 def _get_usage_color(percent: float) -> str:
@@ -70,17 +103,10 @@ def _get_usage_color(percent: float) -> str:
     return "green"
 
 
-def _create_bar(
-    percent: float,
-    width: int = 20,
-    *,
-    filled_char: str = "█",
-    empty_char: str = "░",
-) -> str:
-    """Create a visual progress bar."""
-    filled = int(percent / 100 * width)
-    empty = width - filled
-    return f"{filled_char * filled}{empty_char * empty}"
+def _create_bar(percent: float, width: int = 20) -> str:
+    """Create a visual progress bar (at most BAR_MAX_WIDTH characters wide)."""
+    filled = min(max(int(percent / 100 * width), 0), width)
+    return BAR_FILLED[:filled] + BAR_EMPTY[: width - filled]
 
 
 def print_disks() -> None:
@@ -91,95 +117,333 @@ def print_disks() -> None:
         print("No disk partitions found.", file=sys.stderr)
         return
 
+    # Only emit ANSI colors when writing to a terminal
+    use_color = sys.stdout.isatty()
+    reset = ANSI_RESET if use_color else ""
+
     # Print header
     print(f"{ICON_DISK} Disk Usage")
-    print("=" * 100)
+    print(TABLE_RULE)
     print(f"{'Device':<20} {'Usage':<10} {'Used / Total':<25} {'Bar':<20} {'Mount Point':<20} ")
-    print("-" * 100)
+    print(TABLE_SEPARATOR)
 
     for partition in partitions:
+        if partition.fstype in SKIP_FSTYPES:
+            continue
+
         # Check permissions first to avoid exception in loop
         try:
             usage = psutil.disk_usage(partition.mountpoint)
-        except (PermissionError, OSError):
+        except OSError:
             # Skip partitions we can't access
             continue
 
         try:
             percent = usage.percent
-            color_code = _get_usage_color(percent)
-
-            # ANSI color codes
-            colors = {
-                "red": "\033[91m",
-                "yellow": "\033[93m",
-                "cyan": "\033[96m",
-                "green": "\033[92m",
-            }
-            reset = "\033[0m"
-            color = colors.get(color_code, "")
-
-            used_str = _format_bytes(usage.used)
-            total_str = _format_bytes(usage.total)
-            bar = _create_bar(percent)
-
+            color = ANSI_COLORS.get(_get_usage_color(percent), "") if use_color else ""
             print(
-                f"{partition.device:<20} "
-                f"{color}{percent:>6.1f}%{reset}   "
-                f"{used_str:>8} / {total_str:<8} "
-                f"{color}{bar}{reset} "
-                f"{partition.mountpoint:<20}",
+                DISK_ROW_FORMAT.format_map(
+                    {
+                        "device": partition.device,
+                        "color": color,
+                        "reset": reset,
+                        "percent": percent,
+                        "used": _format_bytes(usage.used),
+                        "total": _format_bytes(usage.total),
+                        "bar": _create_bar(percent),
+                        "mount": partition.mountpoint,
+                    },
+                ),
             )
         except (OSError, ValueError, AttributeError):
             # Skip partitions with invalid data or formatting issues
             continue
 
-    print("=" * 100)
+    print(TABLE_RULE)
+
 
+class SizeStore:
+    """
+    Per-directory file totals persisted across runs in an SQLite database.
+
+    For each directory the combined size of the files directly inside it is
+    stored together with the directory's modification time, and only returned
+    while that time is unchanged. Directories are still walked on every run;
+    only the stat calls for the files of unchanged directories are skipped.
+    A directory's mtime does not change when a file inside it grows in place,
+    so such changes are only picked up by an explicit refresh.
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        """Open (or create) the database; sizes are loaded per scanned tree."""
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Scans run on worker threads; every use of the connection holds the lock
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS sizes (path TEXT PRIMARY KEY, mtime REAL, size INTEGER)",
+        )
+        self._sizes: dict[str, tuple[float, int]] = {}
+        self._loaded: set[str] = set()
+        self._dirty: set[str] = set()
+        # Directories whose entries were listed, and the subdirectories seen there
+        self._listed: set[str] = set()
+        self._seen: set[str] = set()
+        self._lock = threading.Lock()
+
+    def load_tree(self, path: str) -> None:
+        """Load the stored sizes of path and everything below it, unless already loaded."""
+        with self._lock:
+            # A scanned directory exists, even if its parent was listed before it was created
+            self._seen.add(path)
+        ancestor = path
+        while ancestor not in self._loaded:
+            parent = os.path.dirname(ancestor)  # noqa: PTH120
+            if parent == ancestor:
+                break
+            ancestor = parent
+        else:
+            return
+
+        prefix = path.rstrip(os.sep) + os.sep
+        # Paths below path sort between prefix and prefix with its separator incremented
+        end = prefix[:-1] + chr(ord(os.sep) + 1)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT path, mtime, size FROM sizes WHERE path = ? OR (path >= ? AND path < ?)",
+                (path, prefix, end),
+            ).fetchall()
+            for key, mtime, size in rows:
+                if key not in self._sizes and key not in self._dirty:
+                    self._sizes[key] = (mtime, size)
+            self._loaded.add(path)
+
+    def get(self, path: str, mtime: float) -> int | None:
+        """Return the stored file total of path, or None if missing or outdated."""
+        stored = self._sizes.get(path)
+        if stored is None or stored[0] != mtime:
+            return None
+        return stored[1]
+
+    def put(self, path: str, mtime: float, size: int) -> None:
+        """Store the file total of path; it is written to disk on the next commit."""
+        with self._lock:
+            self._sizes[path] = (mtime, size)
+            self._dirty.add(path)
+
+    def mark_listed(self, path: str, subdirs: list[str]) -> None:
+        """Record the subdirectories found in path, so stored paths that are gone can be pruned."""
+        with self._lock:
+            self._listed.add(path)
+            self._seen.update(subdirs)
+
+    def discard_tree(self, path: str) -> None:
+        """Forget the stored sizes of path and everything below it."""
+        prefix = path.rstrip(os.sep) + os.sep
+        end = prefix[:-1] + chr(ord(os.sep) + 1)
+        with self._lock, self._conn:
+            for key in [k for k in self._sizes if k == path or k.startswith(prefix)]:
+                del self._sizes[key]
+                self._dirty.discard(key)
+            self._conn.execute(
+                "DELETE FROM sizes WHERE path = ? OR (path >= ? AND path < ?)",
+                (path, prefix, end),
+            )
+
+    def clear(self) -> None:
+        """Forget all stored sizes."""
+        with self._lock, self._conn:
+            self._sizes.clear()
+            self._dirty.clear()
+            self._conn.execute("DELETE FROM sizes")
+
+    def _prune(self) -> list[str]:
+        """Drop the sizes of directories that no longer exist and return their paths."""
+        # A stored directory is gone if its parent was listed without it
+        gone = tuple(
+            path.rstrip(os.sep) + os.sep
+            for path in self._sizes
+            if path not in self._seen and os.path.dirname(path) in self._listed  # noqa: PTH120
+        )
+        if not gone:
+            return []
+        removed = [p for p in self._sizes if (p + os.sep).startswith(gone)]
+        for path in removed:
+            del self._sizes[path]
+            self._dirty.discard(path)
+        return removed
+
+    def commit(self) -> None:
+        """Write all changes since the last commit to disk in one transaction."""
+        with self._lock, self._conn:
+            removed = [(p,) for p in self._prune()]
+            updated = [(p, *self._sizes[p]) for p in self._dirty]
+            self._dirty.clear()
+            self._conn.executemany("INSERT OR REPLACE INTO sizes VALUES (?, ?, ?)", updated)
+            self._conn.executemany("DELETE FROM sizes WHERE path = ?", removed)
+
+    def close(self) -> None:
+        """Commit pending changes and close the database."""
+        self.commit()
+        self._conn.close()
+
+
+def _dir_mtime(entry: os.DirEntry[str] | str) -> float | None:
+    """Return the modification time of a directory, or None if it cannot be read."""
+    try:
+        # Plain os calls: the size walk never constructs pathlib objects
+        if isinstance(entry, str):
+            return os.stat(entry).st_mtime  # noqa: PTH116
+        return entry.stat(follow_symlinks=False).st_mtime
+    except OSError:
+        return None
+
+
+def _list_dir(path: str, *, stat_files: bool) -> tuple[int, list[os.DirEntry[str]], int, bool]:
+    """
+    Read a single directory level.
+
+    Returns the combined size of its files (0 unless stat_files), its
+    subdirectories, the number of entries, and whether it could be read completely.
+    """
+    files = 0
+    subdirs: list[os.DirEntry[str]] = []
+    count = 0
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                count += 1
+                # The type checks are answered from the directory read itself;
+                # only stat can fail for an individual entry
+                if entry.is_symlink():
+                    # Skip symbolic links to avoid infinite loops
+                    continue
+                if entry.is_file(follow_symlinks=False):
+                    if not stat_files:
+                        continue
+                    try:
+                        files += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        # Skip files we can't access
+                        continue
+                elif entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry)
+    except OSError:
+        # Directories we can't read count as empty
+        return files, subdirs, count, False
+    return files, subdirs, count, True
+
+
+def _scan_dir(
+    path: str,
+    mtime: float | None,
+    cache: dict[str, int] | None,
+    store: SizeStore | None,
+) -> tuple[int, list[tuple[str, float | None]], int]:
+    """
+    Scan a single directory level.
 
-def _get_dir_size(path: Path, cache: dict[str, int] | None = None) -> int:
+    Returns the combined size of its files and already cached subdirectories,
+    the paths and mtimes of the subdirectories that still need to be scanned,
+    and the number of entries in the directory. With a store, the files of a
+    directory whose mtime is unchanged are not stat'ed again.
+    """
+    use_store = store is not None and mtime is not None
+    stored = store.get(path, mtime) if use_store else None
+    files, entries, count, complete = _list_dir(path, stat_files=stored is None)
+    if use_store and complete:
+        if stored is None:
+            store.put(path, mtime, files)
+        store.mark_listed(path, [entry.path for entry in entries])
+
+    size = files if stored is None else stored
+    subdirs: list[tuple[str, float | None]] = []
+    for entry in entries:
+        if cache is not None and entry.path in cache:
+            size += cache[entry.path]
+        else:
+            subdirs.append((entry.path, _dir_mtime(entry) if store is not None else None))
+    return size, subdirs, count
+
+
+def _forget_tree(cache: dict[str, int], path: str) -> None:
+    """Drop the cached sizes of path, everything below it and its ancestors, which include it."""
+    prefix = path.rstrip(os.sep) + os.sep
+    # Scans may still add keys from worker threads; list() copies the keys atomically
+    for key in [k for k in list(cache) if k.startswith(prefix)]:
+        cache.pop(key, None)
+    ancestor = path
+    while True:
+        cache.pop(ancestor, None)
+        parent = os.path.dirname(ancestor)  # noqa: PTH120
+        if parent == ancestor:
+            break
+        ancestor = parent
+
+
+def _get_dir_size(
+    path: str | os.PathLike[str],
+    cache: dict[str, int] | None = None,
+    store: SizeStore | None = None,
+    stop: threading.Event | None = None,
+) -> int:
     """
     Calculate total size of a directory recursively.
 
+    Directories are scanned top-down with an explicit stack and their totals
+    are then folded bottom-up, the same order ``os.walk(topdown=False)`` yields.
+    Already cached subdirectories are not scanned again. Below the root, sizes
+    of leaf directories with fewer than SMALL_DIR_ENTRIES entries are not
+    cached: rescanning them takes a single directory read.
+
     Args:
         path: The directory path to calculate size for
-        cache: Optional cache dictionary to store/retrieve calculated sizes
+        cache: Optional cache dictionary to store/retrieve calculated sizes,
+            keyed by the normalized path string
+        store: Optional persistent store of per-directory file totals, which
+            saves stat calls for the files of unchanged directories
+        stop: Optional event that abandons the scan once set; 0 is returned
+            and nothing is cached
 
     Returns:
         Total size in bytes
 
     """
+    # Normalized, but not resolved: resolving would cost syscalls per path component
+    root = os.path.normpath(os.fspath(path))
+
     # Check cache first if provided
-    if cache is not None:
-        path_str = str(path.resolve())
-        if path_str in cache:
-            return cache[path_str]
+    if cache is not None and root in cache:
+        return cache[root]
 
-    total = 0
-    try:
-        for entry in path.iterdir():
-            try:
-                # Skip symbolic links to avoid infinite loops
-                if entry.is_symlink():
-                    continue
-                if entry.is_file():
-                    total += entry.stat().st_size
-                elif entry.is_dir():
-                    # Recursively get size and cache subdirectories
-                    subdir_size = _get_dir_size(entry, cache)
-                    total += subdir_size
-            except (PermissionError, OSError):
-                # Skip files/dirs we can't access
-                continue
-    except (PermissionError, OSError):
-        pass
-
-    # Store in cache if provided
-    if cache is not None:
-        path_str = str(path.resolve())
-        cache[path_str] = total
-
-    return total
+    root_mtime = None
+    if store is not None:
+        store.load_tree(root)
+        root_mtime = _dir_mtime(root)
+
+    # Directories in scan order, each with its parent and whether it is cached
+    order: list[tuple[str, str | None, bool]] = []
+    totals: dict[str, int] = {}
+    stack: list[tuple[str, float | None, str | None]] = [(root, root_mtime, None)]
+
+    while stack:
+        if stop is not None and stop.is_set():
+            return 0
+        dir_path, mtime, parent = stack.pop()
+        totals[dir_path], subdirs, count = _scan_dir(dir_path, mtime, cache, store)
+        keep = parent is None or bool(subdirs) or count >= SMALL_DIR_ENTRIES
+        order.append((dir_path, parent, keep))
+        stack.extend((subdir, sub_mtime, dir_path) for subdir, sub_mtime in subdirs)
+
+    # Children are always scanned after their parent, so the reversed scan
+    # order visits every directory after all of its subdirectories
+    for dir_path, parent, keep in reversed(order):
+        total = totals[dir_path]
+        if parent is not None:
+            totals[parent] += total
+        if keep and cache is not None:
+            cache[dir_path] = total
+
+    return totals[root]
 
 
 class DiskExplorerApp(App):
@@ -227,13 +491,18 @@ class DiskExplorerApp(App):
     }
     """
 
-    def __init__(self, start_path: Path) -> None:
-        """Initialize the app with a starting path."""
+    def __init__(self, start_path: Path, store: SizeStore | None = None) -> None:
+        """Initialize the app with a starting path and an optional persistent size store."""
         super().__init__()
         self.current_path = start_path.resolve()
         self.sort_column = "size"
         self.sort_reverse = True
         self.size_cache: dict[str, int] = {}  # Cache for directory sizes
+        self.store = store  # Directory sizes persisted across runs
+        # Directory scans are I/O-bound, so threads let the kernel overlap syscalls
+        self._executor = ThreadPoolExecutor(max_workers=SCAN_WORKERS)
+        # Set to abandon the scans of the directory shown before
+        self._scan_stop = threading.Event()
 
     def compose(self) -> ComposeResult:
         """Create child widgets for the app."""
@@ -250,54 +519,38 @@ class DiskExplorerApp(App):
         table.cursor_type = "row"
         self.update_display()
 
-    def update_display(self) -> None:
-        """Update the display with current directory contents."""
-        path_display = self.query_one("#path_display", Static)
-        stats_display = self.query_one("#stats", Static)
-        table = self.query_one(DataTable)
-
-        # Update path display
-        path_display.update(f"📂 Current Path: {self.current_path}")
-
-        # Get disk usage for current partition
-        try:
-            usage = psutil.disk_usage(str(self.current_path))
-            percent = usage.percent
-            used_str = _format_bytes(usage.used)
-            total_str = _format_bytes(usage.total)
-            bar = _create_bar(percent, width=30)
-            stats_display.update(
-                f"Disk Usage: {percent:.1f}% ({used_str} / {total_str})  {bar}",
-            )
-        except (PermissionError, OSError):
-            stats_display.update("Disk Usage: N/A")
-
-        # Clear and populate table
-        table.clear()
-
+    def on_unmount(self) -> None:
+        """Stop the directory scanning threads and save the size store."""
+        self._scan_stop.set()
+        # Running scans return at their next directory; wait so none writes to a closed store
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        if self.store is not None:
+            self.store.close()
+
+    def _list_entries(self) -> list[dict]:
+        """
+        Return the entries of the current directory.
+
+        The size of subdirectories that are not cached yet is None.
+        Raises OSError if the current directory cannot be read.
+        """
         entries = []
 
-        try:
-            # Get all entries in the directory
-            for entry in self.current_path.iterdir():
+        # Get all entries in the directory
+        with os.scandir(self.current_path) as it:
+            for entry in it:
                 try:
                     # Skip symbolic links
                     if entry.is_symlink():
                         continue
 
-                    is_dir = entry.is_dir()
+                    is_dir = entry.is_dir(follow_symlinks=False)
 
                     if is_dir:
-                        # Check cache first
-                        entry_path_str = str(entry.resolve())
-                        if entry_path_str not in self.size_cache:
-                            # Pass cache to _get_dir_size so it can populate subdirectories too
-                            size = _get_dir_size(entry, self.size_cache)
-                        else:
-                            size = self.size_cache[entry_path_str]
+                        size = self.size_cache.get(entry.path)
                         icon = ICON_DIR
                     else:
-                        size = entry.stat().st_size
+                        size = entry.stat(follow_symlinks=False).st_size
                         icon = ICON_FILE
 
                     entries.append(
@@ -306,31 +559,17 @@ class DiskExplorerApp(App):
                             "name": entry.name,
                             "size": size,
                             "is_dir": is_dir,
-                            "path": entry,
+                            "path": entry.path,
                         },
                     )
-                except (PermissionError, OSError):
+                except OSError:
                     # Skip entries we can't access
                     continue
-        except (PermissionError, OSError):
-            self.notify("Permission denied", severity="error")
-            return
 
-        # Sort entries
-        entries.sort(key=lambda e: e["size"], reverse=True)
+        return entries
 
-        # Add ".." entry at the top if not at root
-        parent = self.current_path.parent
-        if parent != self.current_path:
-            table.add_row(
-                "⬆️",
-                "..",
-                "<DIR>",
-                "0",
-                key=str(parent),
-            )
-
-        # Add rows to table
+    def _add_rows(self, table: DataTable, entries: list[dict]) -> None:
+        """Add a table row for each entry."""
         for entry in entries:
             size_str = _format_bytes(entry["size"])
             table.add_row(
@@ -338,15 +577,123 @@ class DiskExplorerApp(App):
                 entry["name"],
                 Text(size_str, justify="right"),
                 Text(str(entry["size"]), justify="right"),
-                key=str(entry["path"]),
+                key=entry["path"],
+            )
+
+    def _show_entries(self, table: DataTable, entries: list[dict]) -> None:
+        """Replace the table contents with the entries, largest first."""
+        entries.sort(key=lambda e: e["size"], reverse=True)
+
+        # Repaint once for the whole table instead of after every row
+        with self.batch_update():
+            table.clear()
+
+            # Add ".." entry at the top if not at root
+            parent = self.current_path.parent
+            if parent != self.current_path:
+                table.add_row(
+                    "⬆️",
+                    "..",
+                    "<DIR>",
+                    "0",
+                    key=str(parent),
+                )
+
+            self._add_rows(table, entries)
+
+    async def _populate_table(self, stop: threading.Event) -> None:
+        """
+        Fill the table with the current directory's entries.
+
+        Entries whose size is known are shown at once. Uncached subdirectories are
+        scanned concurrently on the thread pool and their rows are added as each
+        scan finishes; the table is sorted once all sizes are known. Setting stop
+        abandons the scans that are still running.
+        """
+        table = self.query_one(DataTable)
+        try:
+            entries = self._list_entries()
+        except OSError:
+            table.clear()
+            self.notify("Permission denied", severity="error")
+            return
+
+        known = [entry for entry in entries if entry["size"] is not None]
+        self._show_entries(table, known)
+
+        pending = [entry for entry in entries if entry["size"] is None]
+        if not pending:
+            return
+
+        loop = asyncio.get_running_loop()
+
+        async def scan(entry: dict) -> dict:
+            # Workers walk disjoint subtrees, so they only ever write distinct keys
+            # to the shared cache and each dict operation is atomic
+            entry["size"] = await loop.run_in_executor(
+                self._executor,
+                _get_dir_size,
+                entry["path"],
+                self.size_cache,
+                self.store,
+                stop,
+            )
+            return entry
+
+        for scanned in asyncio.as_completed([scan(entry) for entry in pending]):
+            self._add_rows(table, [await scanned])
+
+        # Rebuilding the table resets the cursor and scroll position. The user may
+        # have been browsing while the scans ran, so keep the selected row where
+        # it was on screen.
+        cursor_row = table.cursor_row
+        cursor_key = table.coordinate_to_cell_key(table.cursor_coordinate).row_key
+        scroll_y = table.scroll_y
+        self._show_entries(table, entries)
+        row = table.get_row_index(cursor_key)
+        table.move_cursor(row=row, scroll=False)
+        table.scroll_to(y=max(scroll_y + row - cursor_row, 0), animate=False, immediate=True)
+
+    def update_display(self) -> None:
+        """Update the display with current directory contents."""
+        path_display = self.query_one("#path_display", Static)
+        stats_display = self.query_one("#stats", Static)
+
+        # Update path display
+        path_display.update(f"📂 Current Path: {self.current_path}")
+
+        # Get disk usage for current partition
+        try:
+            usage = psutil.disk_usage(str(self.current_path))
+            percent = usage.percent
+            used_str = _format_bytes(usage.used)
+            total_str = _format_bytes(usage.total)
+            bar = _create_bar(percent, width=30)
+            stats_display.update(
+                f"Disk Usage: {percent:.1f}% ({used_str} / {total_str})  {bar}",
             )
+        except OSError:
+            stats_display.update("Disk Usage: N/A")
+
+        # Populate the table in the background; navigating again cancels it and
+        # stops the directory scans it started
+        self._scan_stop.set()
+        self._scan_stop = threading.Event()
+        self.run_worker(self._populate_table(self._scan_stop), group="entries", exclusive=True)
 
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         """Handle row selection - navigate into directories."""
         row_key = event.row_key
         path = Path(row_key.value)
 
-        if path.is_dir():
+        # A single stat answers both "is it a directory?" and "how large is it?"
+        try:
+            st = path.stat()
+        except OSError:
+            self.notify("Cannot access file", severity="error")
+            return
+
+        if stat.S_ISDIR(st.st_mode):
             self.current_path = path
             self.update_display()
             # Show appropriate message
@@ -356,12 +703,8 @@ class DiskExplorerApp(App):
                 self.notify(f"Entered: {path.name}")
         else:
             # Show file info
-            try:
-                size = path.stat().st_size
-                size_str = _format_bytes(size)
-                self.notify(f"File: {path.name} ({size_str})")
-            except (PermissionError, OSError):
-                self.notify("Cannot access file", severity="error")
+            size_str = _format_bytes(st.st_size)
+            self.notify(f"File: {path.name} ({size_str})")
 
     def action_up(self) -> None:
         """Go up one directory level."""
@@ -375,14 +718,10 @@ class DiskExplorerApp(App):
 
     def action_refresh(self) -> None:
         """Refresh the current directory display, clearing cache for this directory."""
-        # Clear cache for entries in current directory to force recalculation
-        try:
-            for entry in self.current_path.iterdir():
-                entry_path_str = str(entry.resolve())
-                if entry_path_str in self.size_cache:
-                    del self.size_cache[entry_path_str]
-        except (PermissionError, OSError):
-            pass
+        # Recalculate everything below the current directory, and the totals above it
+        _forget_tree(self.size_cache, str(self.current_path))
+        if self.store is not None:
+            self.store.discard_tree(str(self.current_path))
 
         self.update_display()
         self.notify("Refreshed (cache cleared for current directory)")
@@ -391,6 +730,8 @@ class DiskExplorerApp(App):
         """Clear the entire size cache and refresh."""
         cache_size = len(self.size_cache)
         self.size_cache.clear()
+        if self.store is not None:
+            self.store.clear()
         self.update_display()
         self.notify(f"Cleared entire cache ({cache_size} entries) and refreshed")
 
@@ -414,6 +755,11 @@ def build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Disk name or mount point to explore interactively (omit to show all disks)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Do not read or write directory sizes cached in {SIZE_CACHE_PATH}",
+    )
     return parser
 
 
@@ -439,7 +785,14 @@ def main(argv: list[str] | None = None) -> int:
             print(f"pydisk: not a directory: {path}", file=sys.stderr)
             return 1
 
-        app = DiskExplorerApp(path)
+        store = None
+        if not args.no_cache:
+            try:
+                store = SizeStore(SIZE_CACHE_PATH.expanduser())
+            except (OSError, sqlite3.Error) as e:
+                print(f"pydisk: size cache disabled: {e}", file=sys.stderr)
+
+        app = DiskExplorerApp(path, store)
         app.run()
 
     except KeyboardInterrupt:
@@ -13,6 +13,7 @@ from __future__ import annotations
 
 import argparse
 import os
+import stat
 import sys
 from pathlib import Path
 
@@ -20,6 +21,8 @@ from . import __version__
 
 ICON_DIR = "📁"
 ICON_FILE = "📄"
+# Tree lines are collected and written in chunks of this many lines
+FLUSH_LINES = 4096
 
 
 def _is_hidden(name: str) -> bool:
@@ -31,22 +34,40 @@ def _is_hidden(name: str) -> bool:
     return name.startswith(".")
 
 
-def _iter_entries(path: str, *, show_all: bool) -> list[os.DirEntry]:
+def _file_mode(path: str) -> int:
     """
-    Return a sorted list of DirEntry objects for the given directory.
+    Return the st_mode of path, following symlinks.
+
+    Returns 0 (neither a directory nor a regular file) if path cannot be stat'ed,
+    so a single stat call answers both checks.
+    """
+    try:
+        return Path(path).stat().st_mode
+    except OSError:
+        return 0
+
+
+def _iter_entries(path: str, *, show_all: bool) -> list[tuple[bool, str, str]] | None:
+    """
+    Return a sorted list of (is_dir, name, path) tuples for the given directory.
 
     Sort order: directories first, then files; each group sorted by name (case-insensitive).
-    Hidden files are filtered unless show_all is True.
+    Hidden files are filtered unless show_all is True. Returns None if permission to
+    read the directory is denied, so the caller can report it in order with its output.
     """
     try:
         with os.scandir(path) as it:
-            entries = [e for e in it if show_all or not _is_hidden(e.name)]
+            # Decorate with the sort key once so sorting compares plain tuples:
+            # directories first, then files; case-insensitive by name
+            decorated = [
+                (not e.is_dir(follow_symlinks=False), e.name.lower(), e.name, e.path)
+                for e in it
+                if show_all or not _is_hidden(e.name)
+            ]
     except PermissionError:
-        print(f"shea: permission denied: {path}", file=sys.stderr)
-        return []
-    # Directories first, then files; case-insensitive by name
-    entries.sort(key=lambda e: (not e.is_dir(follow_symlinks=False), e.name.lower()))
-    return entries
+        return None
+    decorated.sort()
+    return [(not is_file, name, entry_path) for is_file, _, name, entry_path in decorated]
 
 
 def print_listing(path: str, *, show_all: bool = False) -> None:
@@ -56,11 +77,16 @@ def print_listing(path: str, *, show_all: bool = False) -> None:
     - Directories listed before files, each sorted by name.
     - Uses icons for folders and files.
     """
-    if Path(path).is_dir():
-        for entry in _iter_entries(path, show_all=show_all):
-            icon = ICON_DIR if entry.is_dir(follow_symlinks=False) else ICON_FILE
-            print(f"{icon} {entry.name}")
-    elif Path(path).is_file():
+    mode = _file_mode(path)
+    if stat.S_ISDIR(mode):
+        entries = _iter_entries(path, show_all=show_all)
+        if entries is None:
+            print(f"shea: permission denied: {path}", file=sys.stderr)
+            return
+        sys.stdout.write(
+            "".join(f"{ICON_DIR if is_dir else ICON_FILE} {name}\n" for is_dir, name, _ in entries),
+        )
+    elif stat.S_ISREG(mode):
         print(f"{ICON_FILE} {Path(path).name}")
     else:
         print(f"shea: no such file or directory: {path}", file=sys.stderr)
@@ -75,11 +101,12 @@ def print_tree(path: str, *, show_all: bool = False, max_depth: int | None = Non
     max_depth=None means unlimited. If max_depth=0, only the root line is printed for directories.
     """
     # Normalize path for display
-    if Path(path).is_file():
+    mode = _file_mode(path)
+    if stat.S_ISREG(mode):
         print(f"{ICON_FILE} {path.name}")
         return
 
-    if not Path(path).is_dir():
+    if not stat.S_ISDIR(mode):
         print(f"shea: no such file or directory: {path}", file=sys.stderr)
         return
 
@@ -90,20 +117,41 @@ def print_tree(path: str, *, show_all: bool = False, max_depth: int | None = Non
     if max_depth == 0:
         return
 
-    def walk(dir_path: str, prefix: str, depth_left: int | None) -> None:
+    # Entries still to be printed, in reverse order, as
+    # (is_dir, name, path, prefix, is_last, depth_left). An explicit stack instead
+    # of recursion keeps deep trees from hitting the recursion limit.
+    stack: list[tuple[bool, str, str, str, bool, int | None]] = []
+    out: list[str] = []
+
+    def push_children(dir_path: str, prefix: str, depth_left: int | None) -> None:
         entries = _iter_entries(dir_path, show_all=show_all)
-        total = len(entries)
-        for idx, entry in enumerate(entries):
-            is_last = idx == total - 1
-            connector = "└── " if is_last else "├── "
-            icon = ICON_DIR if entry.is_dir(follow_symlinks=False) else ICON_FILE
-            print(f"{prefix}{connector}{icon} {entry.name}")
-
-            if entry.is_dir(follow_symlinks=False) and (depth_left is None or depth_left > 0):
-                new_prefix = f"{prefix}{'    ' if is_last else '│   '}"
-                walk(entry.path, new_prefix, None if depth_left is None else depth_left - 1)
-
-    walk(path, "", None if max_depth is None else max_depth - 1)
+        if entries is None:
+            # Write the buffered lines first so the error shows up after them
+            sys.stdout.write("".join(out))
+            sys.stdout.flush()
+            out.clear()
+            print(f"shea: permission denied: {dir_path}", file=sys.stderr)
+            return
+        last = len(entries) - 1
+        for idx in range(last, -1, -1):
+            is_dir, name, entry_path = entries[idx]
+            stack.append((is_dir, name, entry_path, prefix, idx == last, depth_left))
+
+    push_children(path, "", None if max_depth is None else max_depth - 1)
+    while stack:
+        is_dir, name, entry_path, prefix, is_last, depth_left = stack.pop()
+        connector = "└── " if is_last else "├── "
+        icon = ICON_DIR if is_dir else ICON_FILE
+        out.append(f"{prefix}{connector}{icon} {name}\n")
+        if len(out) >= FLUSH_LINES:
+            sys.stdout.write("".join(out))
+            out.clear()
+
+        if is_dir and (depth_left is None or depth_left > 0):
+            new_prefix = f"{prefix}{'    ' if is_last else '│   '}"
+            push_children(entry_path, new_prefix, None if depth_left is None else depth_left - 1)
+
+    sys.stdout.write("".join(out))
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -9,11 +9,15 @@ Usage examples:
 
 from __future__ import annotations
 
+import asyncio
+import bisect
+import functools
+import heapq
 import operator
 import sys
 import time
-from contextlib import suppress
-from typing import ClassVar
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, NamedTuple
 
 try:
     import psutil
@@ -25,6 +29,7 @@ except ImportError:
     sys.exit(1)
 
 try:
+    from rich.text import Text
     from textual.app import App, ComposeResult
     from textual.containers import Container, Horizontal
     from textual.widgets import DataTable, Footer, Header, Static
@@ -37,58 +42,135 @@ except ImportError:
 
 from . import __version__
 
+if TYPE_CHECKING:
+    from textual.widgets.data_table import RowKey
+
+# Errors of processes that exit or cannot be inspected while being read
+PSUTIL_ERRORS = (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess)
+IS_WIN = sys.platform == "win32"
+IS_LINUX = sys.platform.startswith("linux")
+KTHREADD_PID = 2  # Parent of all Linux kernel threads
 BYTES_UNIT = 1024.0
 SEC_MIN = 60
 SEC_HOUR = 3600
 THRESH_RED = 90
 THRESH_YELLOW = 70
 THRESH_CYAN = 50
-
-
+BAR_MAX_WIDTH = 40
+# Bars are sliced out of these instead of multiplying characters per call
+BAR_FILLED = "█" * BAR_MAX_WIDTH
+BAR_EMPTY = "░" * BAR_MAX_WIDTH
+# Colors for usage below THRESH_CYAN, THRESH_YELLOW, THRESH_RED and above
+BAR_COLOR_CUTOFFS = (THRESH_CYAN, THRESH_YELLOW, THRESH_RED)
+BAR_COLORS = ("green", "cyan", "yellow", "red")
+PROCESS_COLUMNS = ("PID", "USER", "CPU%", "MEMORY", "TIME", "COMMAND")
+PROCESS_ROWS = 50  # Number of processes shown in the table
+PROCESS_REFRESH_INTERVAL = 2.0  # Seconds between process table refreshes
+PROCESS_MIN_DELAY = 0.5  # Minimum pause after a refresh that overran the interval
+DESCENDING_COLUMNS = frozenset({"CPU%", "MEMORY", "TIME"})  # Always sorted highest first
+RESORT_WINDOW = 0.3  # Seconds after a refresh in which sorting reuses its data
+CMDLINE_MAX_CHARS = 60
+
+
+@functools.lru_cache(maxsize=4096)
 def _format_bytes(bytes_val: int) -> str:
-    """Format bytes into human-readable format."""
+    """Format bytes into human-readable format (memoized, RSS values repeat across refreshes)."""
+    size = float(bytes_val)
     for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if bytes_val < BYTES_UNIT:
-            return f"{bytes_val:.1f}{unit}"
-        bytes_val /= BYTES_UNIT
-    return f"{bytes_val:.1f}PB"
+        if size < BYTES_UNIT:
+            return f"{size:.1f}{unit}"
+        size /= BYTES_UNIT
+    return f"{size:.1f}PB"
 
 
 def _format_time(seconds: float) -> str:
     """Format seconds into human-readable time."""
+    # Only whole seconds are shown, so memoize on those
+    return _format_whole_seconds(int(seconds))
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_whole_seconds(seconds: int) -> str:
+    """Format whole seconds into human-readable time."""
     if seconds < SEC_MIN:
-        return f"{int(seconds)}s"
+        return f"{seconds}s"
     if seconds < SEC_HOUR:
-        mins = int(seconds / SEC_MIN)
-        secs = int(seconds % SEC_MIN)
+        mins, secs = divmod(seconds, SEC_MIN)
         return f"{mins}m{secs}s"
-    hours = int(seconds / SEC_HOUR)
-    mins = int((seconds % SEC_HOUR) / SEC_MIN)
-    return f"{hours}h{mins}m"
+    hours, rest = divmod(seconds, SEC_HOUR)
+    return f"{hours}h{rest // SEC_MIN}m"
 
 
-def _create_bar(
-    percent: float,
-    width: int = 30,
-    *,
-    filled_char: str = "█",
-    empty_char: str = "░",
-) -> str:
-    """Create a visual progress bar."""
-    filled = int(percent / 100 * width)
-    empty = width - filled
-    return f"{filled_char * filled}{empty_char * empty}"
+def _create_bar(percent: float, width: int = 30) -> str:
+    """Create a visual progress bar (at most BAR_MAX_WIDTH characters wide)."""
+    filled = min(max(int(percent / 100 * width), 0), width)
+    return BAR_FILLED[:filled] + BAR_EMPTY[: width - filled]
 
 
 def _get_bar_color(percent: float) -> str:
     """Get color based on usage percentage."""
-    if percent >= THRESH_RED:
-        return "red"
-    if percent >= THRESH_YELLOW:
-        return "yellow"
-    if percent >= THRESH_CYAN:
-        return "cyan"
-    return "green"
+    return BAR_COLORS[bisect.bisect_right(BAR_COLOR_CUTOFFS, percent)]
+
+
+@functools.lru_cache(maxsize=4096)
+def _colored_bar(percent: float, width: int) -> tuple[str, str]:
+    """
+    Create a progress bar together with its color.
+
+    Memoized: psutil reports percentages rounded to 0.1, so values repeat often.
+    """
+    return _create_bar(percent, width=width), _get_bar_color(percent)
+
+
+def _truncate_cmdline(parts: list[str], limit: int = CMDLINE_MAX_CHARS) -> str:
+    """Join command line arguments, truncated with "..." to at most `limit` characters."""
+    # Only join the arguments that can be shown; JVMs and browsers pass kilobytes of them
+    length = -1
+    for count, part in enumerate(parts, start=1):
+        length += len(part) + 1
+        if length > limit:
+            return " ".join(parts[:count])[: limit - 3] + "..."
+    return " ".join(parts)
+
+
+class ProcRow(NamedTuple):
+    """Display data of one process; lowercase copies serve case-insensitive sorting."""
+
+    pid: int
+    username: str
+    username_lc: str
+    cpu: float
+    mem_percent: float
+    mem_bytes: int
+    runtime: str
+    runtime_seconds: float
+    cmdline: str
+    cmdline_lc: str
+
+
+class SystemSnapshot:
+    """
+    System-wide stats shared by all widgets.
+
+    Read once per refresh instead of once per widget, so /proc/stat and
+    /proc/meminfo are not parsed several times a second. The process table
+    reuses the PID list instead of listing /proc itself.
+    """
+
+    def __init__(self) -> None:
+        """Take the first snapshot."""
+        self.boot_time = psutil.boot_time()
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Read the current system stats."""
+        # Non-blocking: usage since the last call instead of sleeping to sample it.
+        # The first call only primes psutil's counters and reports 0.
+        self.cpu_percent_per_cpu = psutil.cpu_percent(interval=None, percpu=True)
+        self.vm = psutil.virtual_memory()
+        self.swap = psutil.swap_memory()
+        self.uptime = time.time() - self.boot_time
+        self.pids = psutil.pids()
 
 
 class CPUWidget(Static):
@@ -97,26 +179,33 @@ class CPUWidget(Static):
     def on_mount(self) -> None:
         """Set up the widget when mounted."""
         self.update_cpu()  # Initial update
-        self.set_interval(1, self.update_cpu)
 
     def update_cpu(self) -> None:
         """Update CPU information."""
-        cpu_percent = psutil.cpu_percent(interval=0.1, percpu=True)
+        cpu_percent = self.app.snapshot.cpu_percent_per_cpu
         cpu_count = len(cpu_percent)
 
-        lines = ["🔥 [bold cyan]CPU Usage[/bold cyan]\n"]
+        # Styled Text is rendered as is, without parsing markup on every tick
+        text = Text("🔥 ")
+        text.append("CPU Usage", style="bold cyan")
+        text.append("\n")
 
         for i, percent in enumerate(cpu_percent):
-            bar = _create_bar(percent, width=20)
-            color = _get_bar_color(percent)
-            lines.append(f"Core {i:2d}: [{color}]{bar}[/{color}] {percent:5.1f}%")
+            bar, color = _colored_bar(percent, 20)
+            text.append(f"\nCore {i:2d}: ")
+            text.append(bar, style=color)
+            text.append(f" {percent:5.1f}%")
 
         avg_cpu = sum(cpu_percent) / cpu_count
-        bar = _create_bar(avg_cpu, width=20)
-        color = _get_bar_color(avg_cpu)
-        lines.append(f"\n[bold]Average: [{color}]{bar}[/{color}] {avg_cpu:5.1f}%[/bold]")
+        bar, color = _colored_bar(avg_cpu, 20)
+        text.append("\n\n")
+        average_start = len(text)
+        text.append("Average: ")
+        text.append(bar, style=color)
+        text.append(f" {avg_cpu:5.1f}%")
+        text.stylize("bold", average_start)
 
-        self.update("\n".join(lines))
+        self.update(text)
 
 
 class MemoryWidget(Static):
@@ -125,31 +214,32 @@ class MemoryWidget(Static):
     def on_mount(self) -> None:
         """Set up the widget when mounted."""
         self.update_memory()  # Initial update
-        self.set_interval(1, self.update_memory)
 
     def update_memory(self) -> None:
         """Update memory information."""
-        mem = psutil.virtual_memory()
-        swap = psutil.swap_memory()
-
-        mem_bar = _create_bar(mem.percent, width=40)
-        mem_color = _get_bar_color(mem.percent)
-
-        swap_bar = _create_bar(swap.percent, width=40)
-        swap_color = _get_bar_color(swap.percent)
-
-        lines = [
-            "💾 [bold cyan]Memory Usage[/bold cyan]\n",
-            f"RAM:  [{mem_color}]{mem_bar}[/{mem_color}]",
-            f"      {mem.percent:5.1f}% ({_format_bytes(mem.used)} / {_format_bytes(mem.total)})\n",
-            f"Swap: [{swap_color}]{swap_bar}[/{swap_color}]",
+        mem = self.app.snapshot.vm
+        swap = self.app.snapshot.swap
+
+        ram_bar, ram_color = _colored_bar(mem.percent, 40)
+        swap_bar, swap_color = _colored_bar(swap.percent, 40)
+        text = Text.assemble(
+            "💾 ",
+            ("Memory Usage", "bold cyan"),
+            "\n\nRAM:  ",
+            (ram_bar, ram_color),
+            (
+                f"\n      {mem.percent:5.1f}% ("
+                f"{_format_bytes(mem.used)} / {_format_bytes(mem.total)})\n"
+            ),
+            "\nSwap: ",
+            (swap_bar, swap_color),
             (
-                f"      {swap.percent:5.1f}% ("
+                f"\n      {swap.percent:5.1f}% ("
                 f"{_format_bytes(swap.used)} / {_format_bytes(swap.total)})"
             ),
-        ]
+        )
 
-        self.update("\n".join(lines))
+        self.update(text)
 
 
 class SystemInfoWidget(Static):
@@ -158,12 +248,11 @@ class SystemInfoWidget(Static):
     def on_mount(self) -> None:
         """Set up the widget when mounted."""
         self.update_info()  # Initial update
-        self.set_interval(2, self.update_info)
 
     def update_info(self) -> None:
         """Update system information."""
-        uptime_seconds = time.time() - psutil.boot_time()
-        process_count = len(psutil.pids())
+        uptime_seconds = self.app.snapshot.uptime
+        process_count = len(self.app.snapshot.pids)
 
         lines = [
             "⚙️ [bold cyan]System Info[/bold cyan]\n",
@@ -180,28 +269,62 @@ class ProcessTable(DataTable):
     # Track sorting state
     sort_column = "CPU%"
     sort_reverse = True
+    # Linux kernel threads are hidden unless toggled on
+    show_kernel = False
     # Track sort order for toggle columns (PID, USER, COMMAND)
     toggle_sort_order: ClassVar[dict[str, bool]] = {}
+    # Sort key of each column
+    sort_keys: ClassVar[dict[str, Callable[[ProcRow], Any]]] = {
+        "PID": operator.attrgetter("pid"),
+        "USER": operator.attrgetter("username_lc"),
+        "CPU%": operator.attrgetter("cpu"),
+        "MEMORY": operator.attrgetter("mem_bytes"),
+        "TIME": operator.attrgetter("runtime_seconds"),
+        "COMMAND": operator.attrgetter("cmdline_lc"),
+    }
 
     def on_mount(self) -> None:
         """Set up the table when mounted."""
+        # Process objects are kept across refreshes so cpu_percent() reports the
+        # usage since the previous refresh
+        self._proc_cache: dict[int, psutil.Process] = {}
+        # User, start time and command line of each cached process, read once
+        self._static_info: dict[int, dict] = {}
+        # Whether each cached process is a kernel thread, checked once per PID
+        self._kernel_threads: dict[int, bool] = {}
+        # Result of the last refresh, re-sorted in memory on rapid header clicks
+        self._last_processes: list[ProcRow] = []
+        self._last_update_ts = 0.0
+        # Displayed rows, top to bottom, with the cell values they currently show
+        self._rows: list[tuple[RowKey, tuple[str, ...]]] = []
         self.cursor_type = "row"
         # Define columns with explicit keys so header-click sorting works reliably
-        self.add_column("PID", key="PID")
-        self.add_column("USER", key="USER")
-        self.add_column("CPU%", key="CPU%")
-        self.add_column("MEMORY", key="MEMORY")
-        self.add_column("TIME", key="TIME")
-        self.add_column("COMMAND", key="COMMAND")
-        self.set_interval(2, self.update_processes)
-
-    def on_data_table_header_selected(self, event: DataTable.HeaderSelected) -> None:
+        for column in PROCESS_COLUMNS:
+            self.add_column(column, key=column)
+        self._in_flight = False
+        self.set_timer(PROCESS_REFRESH_INTERVAL, self._tick)
+
+    async def _tick(self) -> None:
+        """
+        Refresh the process list and schedule the next refresh.
+
+        The next refresh is armed only after this one finished, so a slow refresh
+        (thousands of processes) delays the next one instead of piling up behind it.
+        The tick is skipped if a refresh triggered otherwise is still running.
+        """
+        start = time.monotonic()
+        if not self._in_flight:
+            await self.update_processes()
+        elapsed = time.monotonic() - start
+        self.set_timer(max(PROCESS_MIN_DELAY, PROCESS_REFRESH_INTERVAL - elapsed), self._tick)
+
+    async def on_data_table_header_selected(self, event: DataTable.HeaderSelected) -> None:
         """Handle column header clicks for sorting."""
         column_key = event.column_key
         column_label = str(column_key.value)
 
         # Determine sort order
-        if column_label in {"CPU%", "MEMORY", "TIME"}:
+        if column_label in DESCENDING_COLUMNS:
             # These always sort descending (highest first)
             self.sort_column = column_label
             self.sort_reverse = True
@@ -220,95 +343,168 @@ class ProcessTable(DataTable):
             self.sort_column = column_label
             self.sort_reverse = self.toggle_sort_order[column_label]
 
-        # Immediately update to show new sort
-        self.update_processes()
+        # Immediately update to show new sort. Right after a refresh, re-sort the
+        # data we already have instead of reading every process again.
+        if time.monotonic() - self._last_update_ts < RESORT_WINDOW:
+            self._show_processes(self._sort_processes(self._last_processes))
+        else:
+            await self.update_processes()
 
     def _snapshot_processes(self) -> list[psutil.Process]:
-        """Return a snapshot list of running processes."""
-        return list(psutil.process_iter(["pid"]))
+        """
+        Return a snapshot list of running processes, reusing known Process objects.
+
+        The PIDs come from the app's system snapshot, taken at most a second ago;
+        Process objects are only created for new PIDs, which skips process_iter()'s
+        per-process PID-reuse check. A PID that is reused within one refresh interval
+        keeps the previous process's static info until it exits.
+        """
+        cache: dict[int, psutil.Process] = {}
+        for pid in self.app.snapshot.pids:
+            p = self._proc_cache.get(pid)
+            if p is not None:
+                cache[pid] = p
+                continue
+            try:
+                cache[pid] = psutil.Process(pid)
+            except psutil.NoSuchProcess:
+                continue
+        # Processes that are gone drop out of the caches
+        for pid in self._static_info.keys() - cache.keys():
+            del self._static_info[pid]
+        for pid in self._kernel_threads.keys() - cache.keys():
+            del self._kernel_threads[pid]
+        self._proc_cache = cache
+        return list(cache.values())
+
+    def _is_kernel_thread(self, p: psutil.Process) -> bool:
+        """Check whether a process is a Linux kernel thread (kthreadd or one of its children)."""
+        if not IS_LINUX:
+            return False
+        is_kernel = self._kernel_threads.get(p.pid)
+        if is_kernel is None:
+            is_kernel = KTHREADD_PID in (p.pid, p.ppid())
+            self._kernel_threads[p.pid] = is_kernel
+        return is_kernel
 
     @staticmethod
-    def _prime_cpu(procs: list[psutil.Process]) -> None:
-        """Prime CPU counters for each process so next read gives a delta."""
-        for p in procs:
-            with suppress(psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                p.cpu_percent(None)
+    def _read_static_info(p: psutil.Process) -> dict:
+        """Read the attributes of a process that do not change during its lifetime."""
+        cmdline_list = p.cmdline()
+        # Kernel threads and some zombies have no command line; show their name instead
+        cmdline = _truncate_cmdline(cmdline_list) if cmdline_list else p.name()
+
+        username = p.username()
+        if IS_WIN:
+            # Drop the DOMAIN\ prefix of Windows account names
+            username = username.rsplit("\\", 1)[-1]
+        username = username[:12]
+        return {
+            "username": username,
+            "username_lc": username.lower(),
+            "create_time": p.create_time(),
+            "cmdline": cmdline,
+            "cmdline_lc": cmdline.lower(),
+        }
 
-    @staticmethod
-    def _gather_info(procs: list[psutil.Process], now: float) -> list[dict]:
+    def _gather_info(self, procs: list[psutil.Process], now: float) -> list[ProcRow]:
         """Gather display info for processes."""
-        items: list[dict] = []
+        items: list[ProcRow] = []
+        # memory_percent() would read the system memory total again for every process
+        total_mem = self.app.snapshot.vm.total
         for p in procs:
-            with suppress(psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            try:
+                # Skipped before oneshot() so hidden kernel threads cost no /proc reads
+                if not self.show_kernel and self._is_kernel_thread(p):
+                    continue
+                static = self._static_info.get(p.pid)
                 with p.oneshot():
-                    pid = p.pid
-                    name = p.name()
-                    username = p.username()
                     cpu = p.cpu_percent(None) or 0.0
-                    mem_percent = p.memory_percent() or 0.0
                     mem_info = p.memory_info()
                     mem_bytes = mem_info.rss if mem_info else 0
-                    create_time = p.create_time()
-                    cmdline_list = p.cmdline()
-
-                cmdline = " ".join(cmdline_list) if cmdline_list else name
-                max_chars = 60
-                if len(cmdline) > max_chars:
-                    cmdline = cmdline[: max_chars - 3] + "..."
-
-                runtime_seconds = now - create_time
-                runtime = _format_time(runtime_seconds)
-                username_short = username.split("\\")[-1][:12]
-
-                items.append(
-                    {
-                        "pid": pid,
-                        "username": username_short,
-                        "cpu": cpu,
-                        "mem_percent": mem_percent,
-                        "mem_bytes": mem_bytes,
-                        "runtime": runtime,
-                        "runtime_seconds": runtime_seconds,
-                        "cmdline": cmdline,
-                    },
-                )
+                    mem_percent = 100.0 * mem_bytes / total_mem if total_mem else 0.0
+                    if static is None:
+                        static = self._read_static_info(p)
+                        self._static_info[p.pid] = static
+            except PSUTIL_ERRORS:
+                continue
+
+            runtime_seconds = now - static["create_time"]
+
+            items.append(
+                ProcRow(
+                    pid=p.pid,
+                    username=static["username"],
+                    username_lc=static["username_lc"],
+                    cpu=cpu,
+                    mem_percent=mem_percent,
+                    mem_bytes=mem_bytes,
+                    runtime=_format_time(runtime_seconds),
+                    runtime_seconds=runtime_seconds,
+                    cmdline=static["cmdline"],
+                    cmdline_lc=static["cmdline_lc"],
+                ),
+            )
         return items
 
-    def _sort_processes(self, processes: list[dict]) -> None:
-        """Sort processes in-place based on current sort column/direction."""
-        key_funcs: dict[str, callable] = {
-            "PID": operator.itemgetter("pid"),
-            "USER": lambda p: p["username"].lower(),
-            "CPU%": operator.itemgetter("cpu"),
-            "MEMORY": operator.itemgetter("mem_bytes"),
-            "TIME": operator.itemgetter("runtime_seconds"),
-            "COMMAND": lambda p: p["cmdline"].lower(),
-        }
-        key_func = key_funcs.get(self.sort_column, operator.itemgetter("cpu"))
-        processes.sort(key=key_func, reverse=self.sort_reverse)
-
-    def update_processes(self) -> None:
-        """Update the process list."""
-        self.clear()
+    def _sort_processes(self, processes: list[ProcRow]) -> list[ProcRow]:
+        """Return the rows to display, ordered by the current sort column/direction."""
+        key_func = self.sort_keys.get(self.sort_column, self.sort_keys["CPU%"])
+        if self.sort_reverse and self.sort_column in DESCENDING_COLUMNS:
+            # Only the top rows are shown; a bounded heap avoids sorting every process
+            return heapq.nlargest(PROCESS_ROWS, processes, key=key_func)
+        return sorted(processes, key=key_func, reverse=self.sort_reverse)[:PROCESS_ROWS]
 
+    def _collect_processes(self) -> tuple[list[ProcRow], list[ProcRow]]:
+        """Read process info and pick the rows to show; runs on the app's worker thread."""
         now = time.time()
         procs = self._snapshot_processes()
-        self._prime_cpu(procs)
-        time.sleep(0.1)
         processes = self._gather_info(procs, now)
-        self._sort_processes(processes)
-
-        # Add top 50 processes
-        for proc in processes[:50]:
-            mem_display = f"{proc['mem_percent']:.1f}% / {_format_bytes(proc['mem_bytes'])}"
-            self.add_row(
-                str(proc["pid"]),
-                proc["username"],
-                f"{proc['cpu']:.1f}%",
-                mem_display,
-                proc["runtime"],
-                proc["cmdline"],
+        return processes, self._sort_processes(processes)
+
+    async def update_processes(self) -> None:
+        """Update the process list."""
+        # Reading /proc for every process is I/O-bound; keep it off the UI thread
+        loop = asyncio.get_running_loop()
+        self._in_flight = True
+        try:
+            processes, rows = await loop.run_in_executor(self.app.executor, self._collect_processes)
+        finally:
+            self._in_flight = False
+        # Keep every process so a re-sort can pick a different top set
+        self._last_processes = processes
+        self._last_update_ts = time.monotonic()
+        self._show_processes(rows)
+
+    def _show_processes(self, processes: list[ProcRow]) -> None:
+        """
+        Show the top processes in the table.
+
+        Rows are updated in place and only cells whose text changed are touched,
+        so the table keeps its cursor and scroll position between refreshes.
+        """
+        shown: list[tuple[RowKey, tuple[str, ...]]] = []
+        for i, proc in enumerate(processes):
+            cells = (
+                str(proc.pid),
+                proc.username,
+                f"{proc.cpu:.1f}%",
+                f"{proc.mem_percent:.1f}% / {_format_bytes(proc.mem_bytes)}",
+                proc.runtime,
+                proc.cmdline,
             )
+            if i < len(self._rows):
+                row_key, old_cells = self._rows[i]
+                for column, old, new in zip(PROCESS_COLUMNS, old_cells, cells):
+                    if old != new:
+                        self.update_cell(row_key, column, new, update_width=True)
+            else:
+                row_key = self.add_row(*cells)
+            shown.append((row_key, cells))
+
+        for row_key, _ in self._rows[len(shown) :]:
+            self.remove_row(row_key)
+        self._rows = shown
 
 
 class PyTopApp(App):
@@ -362,8 +558,35 @@ class PyTopApp(App):
     BINDINGS = [  # noqa: RUF012
         ("q", "quit", "Quit"),
         ("r", "refresh", "Refresh"),
+        ("k", "toggle_kernel", "Kernel threads"),
     ]
 
+    def __init__(self) -> None:
+        """Initialize the app."""
+        super().__init__()
+        # A single background thread serializes process table refreshes
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.snapshot = SystemSnapshot()
+
+    def on_mount(self) -> None:
+        """Start refreshing the system stats."""
+        # One timer reads the stats and redraws every widget showing them
+        self.set_interval(1, self.update_stats)
+
+    def update_stats(self) -> None:
+        """Take a new system snapshot and show it in the stats widgets."""
+        self.snapshot.refresh()
+        for widget in self.query(CPUWidget):
+            widget.update_cpu()
+        for widget in self.query(MemoryWidget):
+            widget.update_memory()
+        for widget in self.query(SystemInfoWidget):
+            widget.update_info()
+
+    def on_unmount(self) -> None:
+        """Stop the background thread."""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
     def compose(self) -> ComposeResult:
         """Create child widgets for the app."""
         yield Header(show_clock=True)
@@ -376,16 +599,17 @@ class PyTopApp(App):
         yield ProcessTable()
         yield Footer()
 
-    def action_refresh(self) -> None:
+    async def action_refresh(self) -> None:
         """Refresh all widgets."""
-        for widget in self.query(CPUWidget):
-            widget.update_cpu()
-        for widget in self.query(MemoryWidget):
-            widget.update_memory()
-        for widget in self.query(SystemInfoWidget):
-            widget.update_info()
+        self.update_stats()
+        for widget in self.query(ProcessTable):
+            await widget.update_processes()
+
+    async def action_toggle_kernel(self) -> None:
+        """Show or hide Linux kernel threads in the process table."""
         for widget in self.query(ProcessTable):
-            widget.update_processes()
+            widget.show_kernel = not widget.show_kernel
+            await widget.update_processes()
 
 
 def main() -> None:
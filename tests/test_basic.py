@@ -1,7 +1,17 @@
+import sqlite3
+from contextlib import closing
+
 import pytest
-from shea.pydisk import _format_bytes, _get_dir_size
+from shea.pydisk import (
+    SMALL_DIR_ENTRIES,
+    SizeStore,
+    _forget_tree,
+    _format_bytes,
+    _get_dir_size,
+)
 from shea.pydisk import main as pydisk_main
 from shea.pyls import main
+from shea.pytop import _truncate_cmdline
 
 
 def test_main_runs(tmp_path, capsys) -> None:
@@ -78,6 +88,10 @@ def test_get_dir_size_with_cache(tmp_path) -> None:
     subdir = tmp_path / "subdir"
     subdir.mkdir()
     (subdir / "file2.txt").write_text("b" * file2_size, encoding="utf-8")
+    large_dir = tmp_path / "large"
+    large_dir.mkdir()
+    for i in range(SMALL_DIR_ENTRIES):
+        (large_dir / f"{i}.txt").touch()
 
     cache = {}
 
@@ -85,7 +99,9 @@ def test_get_dir_size_with_cache(tmp_path) -> None:
     size1 = _get_dir_size(tmp_path, cache)
     assert size1 >= expected_min_size
     assert str(tmp_path.resolve()) in cache
-    assert str(subdir.resolve()) in cache
+    assert str(large_dir.resolve()) in cache
+    # Small subdirectories are cheap to rescan and not cached
+    assert str(subdir.resolve()) not in cache
 
     # Second call - should use cache
     size2 = _get_dir_size(tmp_path, cache)
@@ -151,3 +167,85 @@ def test_pydisk_file_path(tmp_path, capsys) -> None:
 
     err = capsys.readouterr().err
     assert "not a directory" in err
+
+
+def test_get_dir_size_with_store(tmp_path) -> None:
+    """Test that stored file totals are reused and changes below a directory are found."""
+    root_size = 100
+    subdir_size = 10
+    added_size = 50
+    tree = tmp_path / "tree"
+    subdir = tree / "subdir"
+    gone = tree / "gone"
+    subdir.mkdir(parents=True)
+    gone.mkdir()
+    (tree / "file.txt").write_text("a" * root_size, encoding="utf-8")
+    (subdir / "file.txt").write_text("b" * subdir_size, encoding="utf-8")
+    db_path = tmp_path / "cache" / "sizes.sqlite"
+
+    store = SizeStore(db_path)
+    assert _get_dir_size(tree, store=store) == root_size + subdir_size
+    store.close()
+
+    # A fresh store reads the file totals of the scanned tree back from disk
+    store = SizeStore(db_path)
+    store.load_tree(str(tree))
+    assert store.get(str(tree), tree.stat().st_mtime) == root_size
+    assert store.get(str(subdir), subdir.stat().st_mtime) == subdir_size
+
+    # Files added deeper in the tree are found although the root is unchanged
+    (subdir / "new.txt").write_text("c" * added_size, encoding="utf-8")
+    gone.rmdir()
+    assert _get_dir_size(tree, store=store) == root_size + subdir_size + added_size
+
+    # Directories created after their parent was listed are kept when scanned on their own
+    created = tree / "created"
+    created.mkdir()
+    assert _get_dir_size(created, store=store) == 0
+    store.close()
+
+    # Directories that no longer exist are pruned from the database
+    with closing(sqlite3.connect(db_path)) as conn:
+        paths = {path for (path,) in conn.execute("SELECT path FROM sizes")}
+    assert paths == {str(tree), str(subdir), str(created)}
+
+
+def test_forget_tree_rescans_files_grown_in_place(tmp_path) -> None:
+    """Test that refreshing a directory picks up files that grew without changing mtimes."""
+    initial_size = 100
+    appended_size = 5000
+    root = tmp_path / "root"
+    deep = root / "a" / "b" / "c"
+    deep.mkdir(parents=True)
+    file = deep / "f"
+    file.write_bytes(b"x" * initial_size)
+    db_path = tmp_path / "cache" / "sizes.sqlite"
+
+    store = SizeStore(db_path)
+    _get_dir_size(root, store=store)
+    store.close()
+
+    # Appending does not change any directory's mtime, so the stored total is reused
+    with file.open("ab") as f:
+        f.write(b"y" * appended_size)
+    store = SizeStore(db_path)
+    cache = {}
+    for path in (deep, deep.parent, deep.parent.parent, root):
+        _get_dir_size(path, cache, store)
+    assert cache[str(root)] == initial_size
+    _get_dir_size(tmp_path, cache)
+
+    # A refresh of root forgets the totals below and above it, as pressing "r" does
+    _forget_tree(cache, str(root))
+    store.discard_tree(str(root))
+    assert str(deep.parent) not in cache
+    assert str(tmp_path) not in cache
+    assert _get_dir_size(root, cache, store) == initial_size + appended_size
+    store.close()
+
+
+def test_truncate_cmdline() -> None:
+    """Ensure long command lines are cut to the limit and short ones are kept."""
+    assert _truncate_cmdline(["python", "-m", "pytest"]) == "python -m pytest"
+    assert _truncate_cmdline(["a" * 5, "b" * 5], limit=11) == "aaaaa bbbbb"
+    assert _truncate_cmdline(["a" * 5, "b" * 5, "c" * 100], limit=12) == "aaaaa bbb..."